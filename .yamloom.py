@@ -1,5 +1,6 @@
 from yamloom.actions.toolchains.rust import SetupRust
 from dataclasses import dataclass
+from functools import lru_cache
 from yamloom.actions.github.artifacts import DownloadArtifact, UploadArtifact
 from yamloom.actions.github.release import ReleasePlease
 from yamloom.actions.packaging.python import Maturin
@@ -21,14 +22,14 @@ from yamloom import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Target:
     runner: str
     target: str
-    skip_python_versions: list[str] | None = None
+    skip_python_versions: tuple[str, ...] = ()
 
 
-DEFAULT_PYTHON_VERSIONS = [
+DEFAULT_PYTHON_VERSIONS = (
     '3.9',
     '3.10',
     '3.11',
@@ -38,222 +39,236 @@ DEFAULT_PYTHON_VERSIONS = [
     '3.14',
     '3.14t',
     'pypy3.11',
-]
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve_python_versions(skip: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(version for version in DEFAULT_PYTHON_VERSIONS if version not in skip)
+
+
+def resolve_python_versions(skip: tuple[str, ...]) -> list[str]:
+    return list(_resolve_python_versions(skip))
+
+
+_CHECK = context.matrix.check.as_str()
+_PLATFORM = context.matrix.platform
+_TARGET = _PLATFORM.target.as_str()
+_RUNNER = _PLATFORM.runner.as_str()
+_ARCH = _PLATFORM.python_arch.as_str()
+_PYVERS = _PLATFORM.python_interpreters.as_str()
+_PY_VERSION_LINES = _PLATFORM.python_version_lines.as_str()
+_TAG_REF = context.github.ref.startswith('refs/tags/')
+_DISPATCH = context.github.event_name == 'workflow_dispatch'
+_TAG_OR_DISPATCH = _TAG_REF | _DISPATCH
+
+
+LINUX_TARGETS = tuple(
+    Target('ubuntu-22.04', target)
+    for target in ('x86_64', 'x86', 'aarch64', 'armv7', 's390x', 'ppc64le')
+)
+MUSLLINUX_TARGETS = tuple(
+    Target('ubuntu-22.04', target) for target in ('x86_64', 'x86', 'aarch64', 'armv7')
+)
+WINDOWS_TARGETS = (
+    Target('windows-latest', 'x64'),
+    Target('windows-latest', 'x86', ('pypy3.11',)),
+    Target(
+        'windows-11-arm',
+        'aarch64',
+        ('3.9', '3.10', '3.11', '3.13t', '3.14t', 'pypy3.11'),
+    ),
+)
+MACOS_TARGETS = (
+    Target('macos-15-intel', 'x86_64'),
+    Target('macos-latest', 'aarch64'),
+)
 
 
-def resolve_python_versions(skip: list[str] | None) -> list[str]:
-    if not skip:
-        return DEFAULT_PYTHON_VERSIONS
-    skipped = set(skip)
-    return [version for version in DEFAULT_PYTHON_VERSIONS if version not in skipped]
+def platform_entry(name: str, target: Target) -> dict[str, object]:
+    python_versions = resolve_python_versions(target.skip_python_versions)
+    entry = {
+        'runner': target.runner,
+        'target': target.target,
+        'python_interpreters': ' '.join(python_versions),
+        'python_version_lines': '\n'.join(python_versions),
+    }
+    python_arch = (
+        ('arm64' if target.target == 'aarch64' else target.target)
+        if name == 'windows'
+        else None
+    )
+    if python_arch is not None:
+        entry['python_arch'] = python_arch
+    return entry
 
 
 def create_build_job(
-    job_name: str, name: str, targets: list[Target], *, needs: list[str]
+    job_name: str, name: str, targets: tuple[Target, ...], *, needs: list[str]
 ) -> Job:
-    def platform_entry(target: Target) -> dict[str, object]:
-        entry = {
-            'runner': target.runner,
-            'target': target.target,
-            'python_versions': resolve_python_versions(target.skip_python_versions),
-        }
-        python_arch = (
-            ('arm64' if target.target == 'aarch64' else target.target)
-            if name == 'windows'
-            else None
-        )
-        if python_arch is not None:
-            entry['python_arch'] = python_arch
-        return entry
-
     return Job(
         steps=[
             Checkout(),
-            script(
-                f'printf "%s\n" {context.matrix.platform.python_versions.as_array().join(" ")} >> version.txt',
-            ),
             SetupPython(
-                python_version_file='version.txt',
-                architecture=context.matrix.platform.python_arch.as_str()
-                if name == 'windows'
-                else None,
+                python_version=_PY_VERSION_LINES,
+                architecture=_ARCH if name == 'windows' else None,
             ),
             Maturin(
                 name='Build wheels',
-                target=context.matrix.platform.target.as_str(),
-                args=f'--release --out dist --interpreter {context.matrix.platform.python_versions.as_array().join(" ")}',
-                sccache=~context.github.ref.startswith('refs/tags/'),
+                target=_TARGET,
+                args=f'--release --out dist --interpreter {_PYVERS}',
+                sccache=~_TAG_REF,
                 manylinux='musllinux_1_2'
                 if name == 'musllinux'
                 else ('auto' if name == 'linux' else None),
             ),
             UploadArtifact(
                 path='dist',
-                artifact_name=f'wheels-{name}-{context.matrix.platform.target}',
+                artifact_name=f'wheels-{name}-{_PLATFORM.target}',
+                if_no_files_found='error',
             ),
         ],
-        runs_on=context.matrix.platform.runner.as_str(),
+        runs_on=_RUNNER,
         strategy=Strategy(
-            fast_fail=False,
+            fast_fail=~_TAG_REF,
             matrix=Matrix(
-                platform=[platform_entry(target) for target in targets],
+                platform=[platform_entry(name, target) for target in targets],
             ),
         ),
         needs=needs,
-        condition=context.github.ref.startswith('refs/tags/')
-        | (context.github.event_name == 'workflow_dispatch'),
+        condition=_TAG_OR_DISPATCH,
     )
 
 
-release_workflow = Workflow(
-    name='Build and Release',
-    on=Events(
-        push=PushEvent(branches=['main'], tags=['*']),
-        pull_request=PullRequestEvent(),
-        workflow_dispatch=WorkflowDispatchEvent(),
-    ),
-    jobs={
-        'build-test-check': Job(
-            steps=[
-                Checkout(),
-                SetupRust(components=['clippy']),
-                SetupUV(python_version='3.9'),
-                script('cargo clippy'),
-                script('cargo test'),
-                script(
-                    'uv venv',
-                    '. .venv/bin/activate',
-                    'echo PATH=$PATH >> $GITHUB_ENV',
-                    'uvx maturin develop --uv',
-                ),
-                script('uv pip install pytest'),
-                script('uvx ruff check'),
-                script('uvx ty check'),
-                script('uv run pytest'),
-            ],
-            runs_on='ubuntu-latest',
-        ),
-        'linux': create_build_job(
-            'Build Linux Wheels',
-            'linux',
-            [
-                Target(
-                    'ubuntu-22.04',
-                    target,
-                )
-                for target in [
-                    'x86_64',
-                    'x86',
-                    'aarch64',
-                    'armv7',
-                    's390x',
-                    'ppc64le',
-                ]
-            ],
-            needs=['build-test-check'],
+def build_workflows() -> tuple[Workflow, Workflow]:
+    release_workflow = Workflow(
+        name='Build and Release',
+        on=Events(
+            push=PushEvent(branches=['main'], tags=['*'], paths_ignore=['**.md']),
+            pull_request=PullRequestEvent(paths_ignore=['**.md']),
+            workflow_dispatch=WorkflowDispatchEvent(),
         ),
-        'musllinux': create_build_job(
-            'Build (musl) Linux Wheels',
-            'musllinux',
-            [
-                Target(
-                    'ubuntu-22.04',
-                    target,
-                )
-                for target in [
-                    'x86_64',
-                    'x86',
-                    'aarch64',
-                    'armv7',
-                ]
-            ],
-            needs=['build-test-check'],
-        ),
-        'windows': create_build_job(
-            'Build Windows Wheels',
-            'windows',
-            [
-                Target(
-                    'windows-latest',
-                    'x64',
-                ),
-                Target('windows-latest', 'x86', ['pypy3.11']),
-                Target(
-                    'windows-11-arm',
-                    'aarch64',
-                    ['3.9', '3.10', '3.11', '3.13t', '3.14t', 'pypy3.11'],
+        jobs={
+            'build-test-check': Job(
+                steps=[
+                    Checkout(),
+                    SetupRust(components=['clippy'], cache_key=_CHECK),
+                    SetupUV(
+                        python_version='3.9',
+                        enable_cache=True,
+                        cache_dependency_glob=['uv.lock', 'pyproject.toml'],
+                        cache_suffix=_CHECK,
+                    ),
+                    script('cargo clippy', condition=_CHECK == 'clippy'),
+                    script('cargo test', condition=_CHECK == 'cargo-test'),
+                    script(
+                        'uv venv',
+                        '. .venv/bin/activate',
+                        'echo PATH=$PATH >> $GITHUB_ENV',
+                        'uvx maturin develop --uv',
+                        condition=(_CHECK == 'lint') | (_CHECK == 'pytest'),
+                    ),
+                    script(
+                        'uv pip install ruff ty',
+                        'ruff check',
+                        'ty check',
+                        condition=_CHECK == 'lint',
+                    ),
+                    script(
+                        'uv pip install pytest',
+                        'pytest',
+                        condition=_CHECK == 'pytest',
+                    ),
+                ],
+                runs_on='ubuntu-latest',
+                strategy=Strategy(
+                    matrix=Matrix(check=['clippy', 'cargo-test', 'lint', 'pytest']),
                 ),
-            ],
-            needs=['build-test-check'],
-        ),
-        'macos': create_build_job(
-            'Build macOS Wheels',
-            'macos',
-            [
-                Target(
-                    'macos-15-intel',
-                    'x86_64',
-                ),
-                Target(
-                    'macos-latest',
-                    'aarch64',
-                ),
-            ],
-            needs=['build-test-check'],
-        ),
-        'sdist': Job(
-            steps=[
-                Checkout(),
-                Maturin(name='Build sdist', command='sdist', args='--out dist'),
-                UploadArtifact(path='dist', artifact_name='wheels-sdist'),
-            ],
-            name='Build Source Distribution',
-            runs_on='ubuntu-22.04',
-            needs=['build-test-check'],
-            condition=context.github.ref.startswith('refs/tags/')
-            | (context.github.event_name == 'workflow_dispatch'),
-        ),
-        'release': Job(
-            steps=[
-                DownloadArtifact(),
-                SetupUV(),
-                script(
-                    'uv publish --trusted-publishing always wheels-*/*',
-                    permissions=Permissions(id_token='write', contents='write'),
-                ),
-            ],
-            name='Release',
-            runs_on='ubuntu-22.04',
-            condition=context.github.ref.startswith('refs/tags/')
-            | (context.github.event_name == 'workflow_dispatch'),
-            needs=['linux', 'musllinux', 'windows', 'macos', 'sdist'],
-            environment=Environment('pypi'),
-        ),
-    },
-)
+            ),
+            'linux': create_build_job(
+                'Build Linux Wheels',
+                'linux',
+                LINUX_TARGETS,
+                needs=['build-test-check'],
+            ),
+            'musllinux': create_build_job(
+                'Build (musl) Linux Wheels',
+                'musllinux',
+                MUSLLINUX_TARGETS,
+                needs=['build-test-check'],
+            ),
+            'windows': create_build_job(
+                'Build Windows Wheels',
+                'windows',
+                WINDOWS_TARGETS,
+                needs=['build-test-check'],
+            ),
+            'macos': create_build_job(
+                'Build macOS Wheels',
+                'macos',
+                MACOS_TARGETS,
+                needs=['build-test-check'],
+            ),
+            'sdist': Job(
+                steps=[
+                    Checkout(),
+                    Maturin(name='Build sdist', command='sdist', args='--out dist'),
+                    UploadArtifact(
+                        path='dist',
+                        artifact_name='wheels-sdist',
+                        if_no_files_found='error',
+                    ),
+                ],
+                name='Build Source Distribution',
+                runs_on='ubuntu-22.04',
+                needs=['build-test-check'],
+                condition=_TAG_OR_DISPATCH,
+            ),
+            'release': Job(
+                steps=[
+                    DownloadArtifact(
+                        pattern='wheels-*', merge_multiple=True, path='dist'
+                    ),
+                    SetupUV(),
+                    script(
+                        'uv publish --trusted-publishing always dist/*',
+                        permissions=Permissions(id_token='write', contents='write'),
+                    ),
+                ],
+                name='Release',
+                runs_on='ubuntu-22.04',
+                condition=_TAG_OR_DISPATCH,
+                needs=['linux', 'musllinux', 'windows', 'macos', 'sdist'],
+                environment=Environment('pypi'),
+            ),
+        },
+    )
 
-version_workflow = Workflow(
-    name='Release Please',
-    on=Events(
-        push=PushEvent(
-            branches=['main'],
+    version_workflow = Workflow(
+        name='Release Please',
+        on=Events(
+            push=PushEvent(
+                branches=['main'],
+            ),
         ),
-    ),
-    jobs={
-        'release-please': Job(
-            steps=[
-                ReleasePlease(
-                    token=context.secrets.RELEASE_PLEASE,
-                    config_file='release-please-config.json',
-                    manifest_file='.release-please-manifest.json',
-                )
-            ],
-            runs_on='ubuntu-latest',
-        )
-    },
-)
+        jobs={
+            'release-please': Job(
+                steps=[
+                    ReleasePlease(
+                        token=context.secrets.RELEASE_PLEASE,
+                        config_file='release-please-config.json',
+                        manifest_file='.release-please-manifest.json',
+                    )
+                ],
+                runs_on='ubuntu-latest',
+            )
+        },
+    )
+
+    return release_workflow, version_workflow
 
 
 if __name__ == '__main__':
+    release_workflow, version_workflow = build_workflows()
     release_workflow.dump('.github/workflows/release.yml')
     version_workflow.dump('.github/workflows/release-please.yml')
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib.util
+import json
+import marshal
 import os
+import site
 import subprocess
 import sys
+import types
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
-
 DEFAULT_CANDIDATES = ('.yamloom.py', 'yamloom.py')
 ENV_VAR = 'YAMLOOM_FILE'
+WORKFLOWS_DIR = Path('.github') / 'workflows'
 
 
 def resolve_target(explicit: str | None) -> Path:
@@ -31,6 +38,148 @@ def resolve_target(explicit: str | None) -> Path:
     )
 
 
+def run_target(target: Path) -> int:
+    argv = sys.argv
+    path = sys.path[:]
+    main_module = sys.modules['__main__']
+    code = load_code(target)
+    module = types.ModuleType('__main__')
+    module.__file__ = str(target)
+    sys.argv = [str(target)]
+    sys.path.insert(0, str(target.resolve().parent))
+    sys.modules['__main__'] = module
+    try:
+        exec(code, module.__dict__)  # noqa: S102
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(exc.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.modules['__main__'] = main_module
+        sys.argv = argv
+        sys.path[:] = path
+    return 0
+
+
+def cache_dir() -> Path:
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'yamloom'
+
+
+def load_code(target: Path) -> types.CodeType:
+    # Compiled code is kept in the user cache rather than a __pycache__
+    # directory, so nothing is written into the project being generated.
+    source = target.read_bytes()
+    key = hashlib.sha256()
+    for part in (importlib.util.MAGIC_NUMBER, str(target).encode()):
+        key.update(part)
+        key.update(b'\0')
+    key.update(source)
+    code_file = cache_dir() / 'bytecode' / f'{key.hexdigest()}.bin'
+    try:
+        code = marshal.loads(code_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        code = None
+    if isinstance(code, types.CodeType):
+        return code
+    code = compile(source, str(target), 'exec')
+    if not sys.dont_write_bytecode:
+        try:
+            code_file.parent.mkdir(parents=True, exist_ok=True)
+            code_file.write_bytes(marshal.dumps(code))
+        except OSError:
+            pass
+    return code
+
+
+def cache_path(target: Path) -> Path:
+    try:
+        yamloom_version = version('yamloom')
+    except PackageNotFoundError:
+        yamloom_version = ''
+    key = hashlib.sha256()
+    for part in (str(target.resolve()).encode(), yamloom_version.encode()):
+        key.update(part)
+        key.update(b'\0')
+    key.update(target.read_bytes())
+    return cache_dir() / f'{key.hexdigest()}.json'
+
+
+def hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def snapshot_workflows(root: Path) -> dict[str, str]:
+    workflows_dir = root / WORKFLOWS_DIR
+    if not workflows_dir.is_dir():
+        return {}
+    return {
+        str(path): hash_file(path)
+        for path in sorted(workflows_dir.iterdir())
+        if path.is_file()
+    }
+
+
+def installed_roots() -> set[Path]:
+    # A .venv in the project root would otherwise put every installed package
+    # under the generator's directory.
+    roots = {sys.prefix, sys.base_prefix, *site.getsitepackages()}
+    return {Path(root).resolve() for root in roots}
+
+
+def local_sources(target: Path) -> dict[str, str]:
+    root = target.resolve().parent
+    installed = installed_roots()
+    sources = {}
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if not module_file:
+            continue
+        path = Path(module_file).resolve()
+        if not path.is_relative_to(root) or not path.is_file():
+            continue
+        if any(path.is_relative_to(prefix) for prefix in installed):
+            continue
+        sources[str(path)] = hash_file(path)
+    return sources
+
+
+def sources_match(sources: dict[str, str]) -> bool:
+    try:
+        return all(hash_file(Path(path)) == digest for path, digest in sources.items())
+    except OSError:
+        return False
+
+
+def is_cached(cache_file: Path, target: Path) -> bool:
+    try:
+        record = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(record, dict):
+        return False
+    workflows = record.get('workflows')
+    return (
+        bool(workflows)
+        and workflows == snapshot_workflows(target.resolve().parent)
+        and sources_match(record.get('sources', {}))
+    )
+
+
+def write_cache(cache_file: Path, target: Path, sources: dict[str, str]) -> None:
+    record = {
+        'workflows': snapshot_workflows(target.resolve().parent),
+        'sources': sources,
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(record))
+    except OSError:
+        pass
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description='Run yamloom workflow generator.')
     parser.add_argument(
@@ -38,6 +187,20 @@ def main() -> int:
         dest='file',
         help='Path to workflow generator script (overrides defaults).',
     )
+    parser.add_argument(
+        '--subprocess',
+        action='store_true',
+        help='Run the workflow generator in a separate Python interpreter.',
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=(
+            'Skip running the workflow generator if neither it, the local modules '
+            'it imported, nor the .github/workflows files next to it have changed. '
+            'With --subprocess only the generator itself is tracked.'
+        ),
+    )
     args = parser.parse_args()
 
     try:
@@ -50,8 +213,22 @@ def main() -> int:
         print(f'Workflow generator not found: {target}', file=sys.stderr)
         return 2
 
-    result = subprocess.run([sys.executable, str(target)])
-    return result.returncode
+    cache_file = cache_path(target) if args.cache else None
+    if cache_file is not None and is_cached(cache_file, target):
+        return 0
+
+    if args.subprocess:
+        returncode = subprocess.run(
+            [sys.executable, str(target)], check=False
+        ).returncode
+        sources: dict[str, str] = {}
+    else:
+        returncode = run_target(target)
+        sources = local_sources(target) if cache_file is not None else {}
+
+    if cache_file is not None and returncode == 0:
+        write_cache(cache_file, target, sources)
+    return returncode
 
 
 if __name__ == '__main__':
@@ -4,20 +4,29 @@ from yamloom.actions.utils import validate_choice
 from typing import TYPE_CHECKING
 
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['Codecov']
 
+_OS_CHOICES = frozenset(
+    ('alpine', 'alpine-arm64', 'linux', 'linux-arm64', 'macos', 'windows')
+)
+_REPORT_TYPES = frozenset(('test_results', 'coverage'))
+_RUN_COMMANDS = frozenset(
+    ('upload-coverage', 'empty-upload', 'pr-base-picking', 'send-notifications')
+)
+
 
 class Codecov(ActionStep):
     """Upload coverage reports to Codecov.
@@ -170,6 +179,7 @@ class Codecov(ActionStep):
     GitHub repository: https://github.com/codecov/codecov-action
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     def __new__(
@@ -236,72 +246,66 @@ class Codecov(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> Codecov:
         options: dict[str, object] = {
-            'base_sha': base_sha,
-            'binary': binary,
-            'codecov_yml_path': codecov_yml_path,
-            'commit_parent': commit_parent,
-            'directory': directory,
-            'disable_file_fixes': disable_file_fixes,
-            'disable_search': disable_search,
-            'disable_safe_directory': disable_safe_directory,
-            'disable_telem': disable_telem,
-            'dry_run': dry_run,
-            'env_vars': env_vars,
-            'exclude': exclude,
-            'fail_ci_if_error': fail_ci_if_error,
-            'files': files,
-            'flags': flags,
-            'force': force,
-            'git_service': git_service,
-            'gcov_args': gcov_args,
-            'gcov_executable': gcov_executable,
-            'gcov_ignore': gcov_ignore,
-            'gcov_include': gcov_include,
-            'handle_no_reports_found': handle_no_reports_found,
-            'job_code': job_code,
-            'name': codecov_name,
-            'network_filter': network_filter,
-            'network_prefix': network_prefix,
-            'os': validate_choice(
-                'os',
-                os,
-                ['alpine', 'alpine-arm64', 'linux', 'linux-arm64', 'macos', 'windows'],
-            ),
-            'override_branch': override_branch,
-            'override_build': override_build,
-            'override_build_url': override_build_url,
-            'override_commit': override_commit,
-            'override_pr': override_pr,
-            'plugins': plugins,
-            'recurse_submodules': recurse_submodules,
-            'report_code': report_code,
-            'report_type': validate_choice(
-                'report_type', report_type, ['test_results', 'coverage']
-            ),
-            'root_dir': root_dir,
-            'run_command': validate_choice(
-                'run_command',
-                run_command,
-                [
-                    'upload-coverage',
-                    'empty-upload',
-                    'pr-base-picking',
-                    'send-notifications',
-                ],
-            ),
-            'skip_validation': skip_validation,
-            'slug': slug,
-            'swift_project': swift_project,
-            'token': token,
-            'url': url,
-            'use_legacy_upload_endpoint': use_legacy_upload_endpoint,
-            'use_oidc': use_oidc,
-            'use_pypi': use_pypi,
-            'verbose': verbose,
-            'version': codecov_version,
-            'working-directory': working_directory,
+            k: v
+            for k, v in (
+                ('base_sha', base_sha),
+                ('binary', binary),
+                ('codecov_yml_path', codecov_yml_path),
+                ('commit_parent', commit_parent),
+                ('directory', directory),
+                ('disable_file_fixes', disable_file_fixes),
+                ('disable_search', disable_search),
+                ('disable_safe_directory', disable_safe_directory),
+                ('disable_telem', disable_telem),
+                ('dry_run', dry_run),
+                ('env_vars', env_vars),
+                ('exclude', exclude),
+                ('fail_ci_if_error', fail_ci_if_error),
+                ('files', files),
+                ('flags', flags),
+                ('force', force),
+                ('git_service', git_service),
+                ('gcov_args', gcov_args),
+                ('gcov_executable', gcov_executable),
+                ('gcov_ignore', gcov_ignore),
+                ('gcov_include', gcov_include),
+                ('handle_no_reports_found', handle_no_reports_found),
+                ('job_code', job_code),
+                ('name', codecov_name),
+                ('network_filter', network_filter),
+                ('network_prefix', network_prefix),
+                ('os', validate_choice('os', os, _OS_CHOICES)),
+                ('override_branch', override_branch),
+                ('override_build', override_build),
+                ('override_build_url', override_build_url),
+                ('override_commit', override_commit),
+                ('override_pr', override_pr),
+                ('plugins', plugins),
+                ('recurse_submodules', recurse_submodules),
+                ('report_code', report_code),
+                (
+                    'report_type',
+                    validate_choice('report_type', report_type, _REPORT_TYPES),
+                ),
+                ('root_dir', root_dir),
+                (
+                    'run_command',
+                    validate_choice('run_command', run_command, _RUN_COMMANDS),
+                ),
+                ('skip_validation', skip_validation),
+                ('slug', slug),
+                ('swift_project', swift_project),
+                ('token', token),
+                ('url', url),
+                ('use_legacy_upload_endpoint', use_legacy_upload_endpoint),
+                ('use_oidc', use_oidc),
+                ('use_pypi', use_pypi),
+                ('verbose', verbose),
+                ('version', codecov_version),
+                ('working-directory', working_directory),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Upload coverage'
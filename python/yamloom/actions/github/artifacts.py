@@ -1,25 +1,31 @@
 from __future__ import annotations
-from yamloom.actions.utils import validate_choice, check_string
+from yamloom.actions.utils import check_string, join_strings, validate_choice
 
+import warnings
 from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 WARN_RETENTION_DAYS: int = 90
 MAX_COMPRESSION_LEVEL: int = 9
 
+_IF_NO_FILES_FOUND = frozenset(('warn', 'error', 'ignore'))
+_RETENTION_WARNING = f'retention days should be <= {WARN_RETENTION_DAYS} unless a higher limit is made in the repository settings!'
+_COMPRESSION_ERROR = f'compression level must be in the range 0-{MAX_COMPRESSION_LEVEL}'
+
 __all__ = [
     'DownloadArtifact',
     'UploadArtifact',
@@ -27,6 +33,23 @@ __all__ = [
 ]
 
 
+def _check_retention_days(retention_days: Ointlike) -> None:
+    # bool is an int subclass, so an exact type check keeps True/False out.
+    if type(retention_days) is int:
+        if retention_days < 1:
+            msg = 'retention days must be > 0'
+            raise ValueError(msg)
+        if retention_days > WARN_RETENTION_DAYS:
+            warnings.warn(_RETENTION_WARNING, UserWarning, stacklevel=3)
+
+
+def _check_compression_level(compression_level: Ointlike) -> None:
+    if type(compression_level) is int and not (
+        0 <= compression_level <= MAX_COMPRESSION_LEVEL
+    ):
+        raise ValueError(_COMPRESSION_ERROR)
+
+
 class UploadArtifact(ActionStep):
     """Upload a build artifact that can be used by subsequent workflow steps.
 
@@ -89,6 +112,7 @@ class UploadArtifact(ActionStep):
     GitHub repository: https://github.com/actions/upload-artifact
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -124,44 +148,30 @@ class UploadArtifact(ActionStep):
         timeout_minutes: Ointlike = None,
         skip_recommended_permissions: bool = False,
     ) -> UploadArtifact:
+        _check_retention_days(retention_days)
+        _check_compression_level(compression_level)
+
         options: dict[str, object] = {
-            'path': path,
-            'name': artifact_name,
-            'if_no_files_found': validate_choice(
-                'if_no_files_found', if_no_files_found, ['warn', 'error', 'ignore']
-            ),
-            'retention-days': retention_days,
-            'compression-level': compression_level,
-            'overwrite': overwrite,
-            'include-hidden-files': include_hidden_files,
+            k: v
+            for k, v in (
+                ('path', path),
+                ('name', artifact_name),
+                (
+                    'if-no-files-found',
+                    validate_choice(
+                        'if_no_files_found', if_no_files_found, _IF_NO_FILES_FOUND
+                    ),
+                ),
+                ('retention-days', retention_days),
+                ('compression-level', compression_level),
+                ('overwrite', overwrite),
+                ('include-hidden-files', include_hidden_files),
+            )
+            if v is not None
         }
 
-        if retention_days is not None:
-            if isinstance(retention_days, int) and not isinstance(retention_days, bool):
-                if retention_days < 1:
-                    msg = 'retention days must be > 0'
-                    raise ValueError(msg)
-                if retention_days > WARN_RETENTION_DAYS:
-                    print(
-                        f'Warning: retention days should be <= {WARN_RETENTION_DAYS} unless a higher limit is made in the repository settings!'
-                    )
-            options['retention-days'] = retention_days
-
-        if compression_level is not None:
-            if (
-                isinstance(compression_level, int)
-                and not isinstance(compression_level, bool)
-            ) and (compression_level < 0 or compression_level > MAX_COMPRESSION_LEVEL):
-                msg = (
-                    f'compression level must be in the range 0-{MAX_COMPRESSION_LEVEL}'
-                )
-                raise ValueError(msg)
-            options['compression-level'] = compression_level
-
-        options = {key: value for key, value in options.items() if value is not None}
-
         if name is None:
-            artifact_str = check_string(options.get('artifact_name'))
+            artifact_str = check_string(artifact_name)
             if artifact_str:
                 name = f'Upload {artifact_str}'
             else:
@@ -248,6 +258,7 @@ class UploadArtifactMerge(ActionStep):
     GitHub repository: https://github.com/actions/upload-artifact
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -283,42 +294,25 @@ class UploadArtifactMerge(ActionStep):
         timeout_minutes: Ointlike = None,
         skip_recommended_permissions: bool = False,
     ) -> UploadArtifactMerge:
+        _check_retention_days(retention_days)
+        _check_compression_level(compression_level)
+
         options: dict[str, object] = {
-            'name': artifact_name,
-            'pattern': pattern,
-            'separate-directories': separate_directories,
-            'delete-merged': delete_merged,
-            'retention-days': retention_days,
-            'compression-level': compression_level,
-            'include-hidden-files': include_hidden_files,
+            k: v
+            for k, v in (
+                ('name', artifact_name),
+                ('pattern', pattern),
+                ('separate-directories', separate_directories),
+                ('delete-merged', delete_merged),
+                ('retention-days', retention_days),
+                ('compression-level', compression_level),
+                ('include-hidden-files', include_hidden_files),
+            )
+            if v is not None
         }
 
-        if retention_days is not None:
-            if isinstance(retention_days, int) and not isinstance(retention_days, bool):
-                if retention_days < 1:
-                    msg = 'retention days must be > 0'
-                    raise ValueError(msg)
-                if retention_days > WARN_RETENTION_DAYS:
-                    print(
-                        f'Warning: retention days should be <= {WARN_RETENTION_DAYS} unless a higher limit is made in the repository settings!'
-                    )
-            options['retention-days'] = retention_days
-
-        if compression_level is not None:
-            if (
-                isinstance(compression_level, int)
-                and not isinstance(compression_level, bool)
-            ) and (compression_level < 0 or compression_level > MAX_COMPRESSION_LEVEL):
-                msg = (
-                    f'compression level must be in the range 0-{MAX_COMPRESSION_LEVEL}'
-                )
-                raise ValueError(msg)
-            options['compression-level'] = compression_level
-
-        options = {key: value for key, value in options.items() if value is not None}
-
         if name is None:
-            artifact_str = check_string(options.get('artifact_name'))
+            artifact_str = check_string(artifact_name)
             if artifact_str:
                 name = f'Upload (merged) {artifact_str}'
             else:
@@ -411,6 +405,7 @@ class DownloadArtifact(ActionStep):
     GitHub repository: https://github.com/actions/download-artifact
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -424,7 +419,7 @@ class DownloadArtifact(ActionStep):
         name: Ostrlike = None,
         version: str = 'v7',
         artifact_name: Ostrlike = None,
-        artifact_ids: list[StringLike] | None = None,
+        artifact_ids: list[StringLike] | tuple[StringLike, ...] | None = None,
         pattern: Ostrlike = None,
         merge_multiple: Oboollike = None,
         github_token: Ostrlike = None,
@@ -440,21 +435,22 @@ class DownloadArtifact(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> DownloadArtifact:
         options: dict[str, object] = {
-            'name': artifact_name,
-            'artifact-ids': ','.join(str(s) for s in artifact_ids)
-            if artifact_ids is not None
-            else None,
-            'pattern': pattern,
-            'path': path,
-            'merge-multiple': merge_multiple,
-            'github-token': github_token,
-            'repository': repository,
-            'run-id': run_id,
+            k: v
+            for k, v in (
+                ('name', artifact_name),
+                ('artifact-ids', join_strings(artifact_ids, ',')),
+                ('pattern', pattern),
+                ('path', path),
+                ('merge-multiple', merge_multiple),
+                ('github-token', github_token),
+                ('repository', repository),
+                ('run-id', run_id),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
-            artifact_str = check_string(options.get('artifact_name'))
+            artifact_str = check_string(artifact_name)
             if artifact_str:
                 name = f'Download {artifact_str}'
             else:
@@ -5,18 +5,19 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 
 __all__ = ['AttestBuildProvenance']
 
@@ -90,6 +91,7 @@ class AttestBuildProvenance(ActionStep):
     GitHub repository: https://github.com/actions/attest-build-provenance
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(
         id_token='write', attestations='write', artifact_metadata='write'
     )
@@ -128,30 +130,31 @@ class AttestBuildProvenance(ActionStep):
         timeout_minutes: Ointlike = None,
         skip_recommended_permissions: bool = False,
     ) -> AttestBuildProvenance:
-        if (
-            sum(
-                value is not None
-                for value in (subject_path, subject_digest, subject_checksums)
-            )
-            != 1
-        ):
+        subjects = (
+            (subject_path is not None)
+            + (subject_digest is not None)
+            + (subject_checksums is not None)
+        )
+        if subjects != 1:
             raise ValueError(
                 'Exactly one of subject_path, subject_digest, or subject_checksums must be set'
             )
 
         options: dict[str, object] = {
-            'subject-path': subject_path,
-            'subject-digest': subject_digest,
-            'subject-checksums': subject_checksums,
-            'subject-name': subject_name,
-            'push-to-registry': push_to_registry,
-            'create-storage-record': create_storage_record,
-            'show-summary': show_summary,
-            'github-token': github_token,
+            k: v
+            for k, v in (
+                ('subject-path', subject_path),
+                ('subject-digest', subject_digest),
+                ('subject-checksums', subject_checksums),
+                ('subject-name', subject_name),
+                ('push-to-registry', push_to_registry),
+                ('create-storage-record', create_storage_record),
+                ('show-summary', show_summary),
+                ('github-token', github_token),
+            )
+            if v is not None
         }
 
-        options = {key: value for key, value in options.items() if value is not None}
-
         if name is None:
             name = 'Create Attestation'
 
@@ -1,23 +1,24 @@
 from __future__ import annotations
+from yamloom.actions.utils import as_list
 
 from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Obool,
-    Oboollike,
-    Oboolstr,
-    Oint,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Obool,
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = [
     'Cache',
     'CacheRestore',
@@ -25,6 +26,27 @@ __all__ = [
 ]
 
 
+_SEGMENT_TIMEOUT_ENV = 'SEGMENT_DOWNLOAD_TIMEOUT_MINS'
+
+
+def _with_segment_timeout(
+    env: Mapping[str, StringLike] | None,
+    segment_download_timeout_mins: Ointlike,
+) -> Mapping[str, StringLike] | None:
+    if segment_download_timeout_mins is None:
+        return env
+    value = (
+        segment_download_timeout_mins
+        if isinstance(segment_download_timeout_mins, str)
+        else str(segment_download_timeout_mins)
+    )
+    return (
+        {_SEGMENT_TIMEOUT_ENV: value}
+        if env is None
+        else {**env, _SEGMENT_TIMEOUT_ENV: value}
+    )
+
+
 class Cache(ActionStep):
     """Cache artifacts like dependencies and build outputs.
 
@@ -58,7 +80,8 @@ class Cache(ActionStep):
         This does not work as intended and will be removed in a future release.
         A separate ``actions/cache/restore`` step should be used instead.
     segment_download_timeout_mins
-        The download segment timeout (in minutes) used by the cache action.
+        The download segment timeout (in minutes) used by the cache action. This is set
+        through the ``SEGMENT_DOWNLOAD_TIMEOUT_MINS`` environment variable of the step.
     args
         The inputs for a Docker container which are passed to the container's entrypoint.
         This is a subkey of the ``with`` key of the generated step.
@@ -90,6 +113,7 @@ class Cache(ActionStep):
     GitHub repository: https://github.com/actions/cache
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -102,14 +126,14 @@ class Cache(ActionStep):
         key: str,
         name: Ostrlike = None,
         version: str = 'v5',
-        path: list[str] | None = None,
-        restore_keys: list[str] | None = None,
+        path: list[str] | tuple[str, ...] | None = None,
+        restore_keys: list[str] | tuple[str, ...] | None = None,
         upload_chunk_size: Ointlike = None,
         enable_cross_os_archive: Obool = None,
         fail_on_cache_miss: Obool = None,
         lookup_only: Obool = None,
         save_always: Obool = None,
-        segment_download_timeout_mins: Oint = None,
+        segment_download_timeout_mins: Ointlike = None,
         args: Ostrlike = None,
         entrypoint: Ostrlike = None,
         condition: Oboolstr = None,
@@ -120,20 +144,25 @@ class Cache(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> Cache:
         options: dict[str, object] = {
-            'key': key,
-            'path': list(path) if path is not None else None,
-            'restore-keys': list(restore_keys) if restore_keys is not None else None,
-            'upload-chunk-size': upload_chunk_size,
-            'enableCrossOsArchive': enable_cross_os_archive,
-            'fail-on-cache-miss': fail_on_cache_miss,
-            'lookup-only': lookup_only,
-            'save-always': save_always,
+            k: v
+            for k, v in (
+                ('key', key),
+                ('path', as_list(path)),
+                ('restore-keys', as_list(restore_keys)),
+                ('upload-chunk-size', upload_chunk_size),
+                ('enableCrossOsArchive', enable_cross_os_archive),
+                ('fail-on-cache-miss', fail_on_cache_miss),
+                ('lookup-only', lookup_only),
+                ('save-always', save_always),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Cache'
 
+        env = _with_segment_timeout(env, segment_download_timeout_mins)
+
         return super().__new__(
             cls,
             name,
@@ -170,8 +199,6 @@ class CacheSave(ActionStep):
     enable_cross_os_archive
         An optional boolean when enabled, allows Windows runners to save caches
         that can be restored on other platforms.
-    segment_download_timeout_mins
-        The download segment timeout (in minutes) used by the cache action.
     args
         The inputs for a Docker container which are passed to the container's entrypoint.
         This is a subkey of the ``with`` key of the generated step.
@@ -203,12 +230,13 @@ class CacheSave(ActionStep):
     GitHub repository: https://github.com/actions/cache
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     def __new__(
         cls,
         *,
-        path: list[str],
+        path: list[str] | tuple[str, ...],
         key: str,
         name: Ostrlike = None,
         version: str = 'v5',
@@ -224,12 +252,15 @@ class CacheSave(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> CacheSave:
         options: dict[str, object] = {
-            'key': key,
-            'path': list(path) if path is not None else None,
-            'upload-chunk-size': upload_chunk_size,
-            'enableCrossOsArchive': enable_cross_os_archive,
+            k: v
+            for k, v in (
+                ('key', key),
+                ('path', as_list(path)),
+                ('upload-chunk-size', upload_chunk_size),
+                ('enableCrossOsArchive', enable_cross_os_archive),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Cache (save)'
@@ -278,7 +309,8 @@ class CacheRestore(ActionStep):
         Check if a cache entry exists for the given input(s) (``key``,
         ``restore_keys``) without downloading the cache.
     segment_download_timeout_mins
-        The download segment timeout (in minutes) used by the cache action.
+        The download segment timeout (in minutes) used by the cache action. This is set
+        through the ``SEGMENT_DOWNLOAD_TIMEOUT_MINS`` environment variable of the step.
     args
         The inputs for a Docker container which are passed to the container's entrypoint.
         This is a subkey of the ``with`` key of the generated step.
@@ -310,6 +342,7 @@ class CacheRestore(ActionStep):
     GitHub repository: https://github.com/actions/cache
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -330,13 +363,13 @@ class CacheRestore(ActionStep):
         key: str,
         name: Ostrlike = None,
         version: str = 'v5',
-        path: list[str] | None = None,
-        restore_keys: list[str] | None = None,
+        path: list[str] | tuple[str, ...] | None = None,
+        restore_keys: list[str] | tuple[str, ...] | None = None,
         upload_chunk_size: Ointlike = None,
         enable_cross_os_archive: Obool = None,
         fail_on_cache_miss: Obool = None,
         lookup_only: Obool = None,
-        segment_download_timeout_mins: Oint = None,
+        segment_download_timeout_mins: Ointlike = None,
         args: Ostrlike = None,
         entrypoint: Ostrlike = None,
         condition: Oboolstr = None,
@@ -347,18 +380,23 @@ class CacheRestore(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> CacheRestore:
         options: dict[str, object] = {
-            'key': key,
-            'path': list(path) if path is not None else None,
-            'restore-keys': list(restore_keys) if restore_keys is not None else None,
-            'enableCrossOsArchive': enable_cross_os_archive,
-            'fail-on-cache-miss': fail_on_cache_miss,
-            'lookup-only': lookup_only,
+            k: v
+            for k, v in (
+                ('key', key),
+                ('path', as_list(path)),
+                ('restore-keys', as_list(restore_keys)),
+                ('enableCrossOsArchive', enable_cross_os_archive),
+                ('fail-on-cache-miss', fail_on_cache_miss),
+                ('lookup-only', lookup_only),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Cache (restore)'
 
+        env = _with_segment_timeout(env, segment_download_timeout_mins)
+
         return super().__new__(
             cls,
             name,
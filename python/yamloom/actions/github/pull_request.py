@@ -6,21 +6,24 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringOrBoolLike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+        StringOrBoolLike,
+    )
+
 __all__ = ['CreatePullRequest']
 
+_BRANCH_SUFFIXES = frozenset(('random', 'timestamp', 'short-commit-hash'))
+
 
 class CreatePullRequest(ActionStep):
     """Creates a pull request for changes to your repository in the actions workspace.
@@ -134,6 +137,7 @@ class CreatePullRequest(ActionStep):
     This action requires you to explicitly allow GitHub Actions to create pull requests. This setting can be found in the repository's settings under ``Actions > General > Workflow permissions``.
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='write', pull_requests='write')
 
     @classmethod
@@ -199,36 +203,38 @@ class CreatePullRequest(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> CreatePullRequest:
         options: dict[str, object] = {
-            'token': token,
-            'branch-token': branch_token,
-            'path': path,
-            'add-paths': add_paths,
-            'commit-message': commit_message,
-            'committer': committer,
-            'author': author,
-            'signoff': signoff,
-            'branch': branch,
-            'delete-branch': delete_branch,
-            'branch-suffix': validate_choice(
-                'branch_suffix',
-                branch_suffix,
-                ['random', 'timestamp', 'short-commit-hash'],
-            ),
-            'base': base,
-            'push-to-fork': push_to_fork,
-            'sign-commits': sign_commits,
-            'title': title,
-            'body': body,
-            'body-path': body_path,
-            'labels': labels,
-            'assignees': assignees,
-            'reviewers': reviewers,
-            'team-reviewers': team_reviewers,
-            'milestone': milestone,
-            'draft': draft,
-            'maintainer-can-modify': maintainer_can_modify,
+            k: v
+            for k, v in (
+                ('token', token),
+                ('branch-token', branch_token),
+                ('path', path),
+                ('add-paths', add_paths),
+                ('commit-message', commit_message),
+                ('committer', committer),
+                ('author', author),
+                ('signoff', signoff),
+                ('branch', branch),
+                ('delete-branch', delete_branch),
+                (
+                    'branch-suffix',
+                    validate_choice('branch_suffix', branch_suffix, _BRANCH_SUFFIXES),
+                ),
+                ('base', base),
+                ('push-to-fork', push_to_fork),
+                ('sign-commits', sign_commits),
+                ('title', title),
+                ('body', body),
+                ('body-path', body_path),
+                ('labels', labels),
+                ('assignees', assignees),
+                ('reviewers', reviewers),
+                ('team-reviewers', team_reviewers),
+                ('milestone', milestone),
+                ('draft', draft),
+                ('maintainer-can-modify', maintainer_can_modify),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Create Pull Request'
@@ -6,25 +6,32 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Obool,
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringOrBoolLike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Obool,
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+        StringOrBoolLike,
+    )
+
 __all__ = [
     'Release',
     'ReleasePlease',
 ]
 
+_DEFAULT_TOKEN = str(context.secrets.github_token)
+
+
+def _component_output(id: str, path: str, output: str) -> StringExpression:
+    return context.steps[id].outputs[f'{path}--{output}']
+
 
 class Release(ActionStep):
     """Create a GitHub release.
@@ -111,6 +118,7 @@ class Release(ActionStep):
     GitHub repository: https://github.com/softprops/action-gh-release
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='write')
 
     @classmethod
@@ -162,29 +170,32 @@ class Release(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> Release:
         options: dict[str, object] = {
-            'body': body,
-            'body_path': body_path,
-            'draft': draft,
-            'prerelease': prerelease,
-            'preserve_order': preserve_order,
-            'files': files,
-            'working_directory': working_directory,
-            'overwrite_files': overwrite_files,
-            'name': release_name,
-            'tag_name': tag_name,
-            'fail_on_unmatched_files': fail_on_unmatched_files,
-            'repository': repository,
-            'target_commitish': target_commitish,
-            'token': token,
-            'discussion_category_name': discussion_category_name,
-            'generate_release_notes': generate_release_notes,
-            'append_body': append_body,
-            'make_latest': make_latest,
+            k: v
+            for k, v in (
+                ('body', body),
+                ('body_path', body_path),
+                ('draft', draft),
+                ('prerelease', prerelease),
+                ('preserve_order', preserve_order),
+                ('files', files),
+                ('working_directory', working_directory),
+                ('overwrite_files', overwrite_files),
+                ('name', release_name),
+                ('tag_name', tag_name),
+                ('fail_on_unmatched_files', fail_on_unmatched_files),
+                ('repository', repository),
+                ('target_commitish', target_commitish),
+                ('token', token),
+                ('discussion_category_name', discussion_category_name),
+                ('generate_release_notes', generate_release_notes),
+                ('append_body', append_body),
+                ('make_latest', make_latest),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
-            repository_str = check_string(options.get('repository'))
+            repository_str = check_string(repository)
             if repository_str:
                 name = f'Release {repository_str}'
             else:
@@ -303,6 +314,7 @@ class ReleasePlease(ActionStep):
     You may have to adjust repository settings to allow GitHub actions to create pull requests: ``Settings > Actions > General``
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(
         contents='write', issues='write', pull_requests='write'
     )
@@ -370,52 +382,52 @@ class ReleasePlease(ActionStep):
     @classmethod
     def release_created_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--release_created`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--release_created']
+        return _component_output(id, path, 'release_created')
 
     @classmethod
     def upload_url_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--upload_url`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--upload_url']
+        return _component_output(id, path, 'upload_url')
 
     @classmethod
     def html_url_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--html_url`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--html_url']
+        return _component_output(id, path, 'html_url')
 
     @classmethod
     def tag_name_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--tag_name`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--tag_name']
+        return _component_output(id, path, 'tag_name')
 
     @classmethod
     def version_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--version`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--version']
+        return _component_output(id, path, 'version')
 
     @classmethod
     def major_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--major`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--major']
+        return _component_output(id, path, 'major')
 
     @classmethod
     def minor_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--minor`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--minor']
+        return _component_output(id, path, 'minor')
 
     @classmethod
     def patch_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--patch`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--patch']
+        return _component_output(id, path, 'patch')
 
     @classmethod
     def sha_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--sha`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--sha']
+        return _component_output(id, path, 'sha')
 
     @classmethod
     def body_for(cls, id: str, path: str) -> StringExpression:
         """Return ``<path>--body`` output for a component path."""
-        return context.steps[id].outputs[f'{path}--body']
+        return _component_output(id, path, 'body')
 
     def __new__(
         cls,
@@ -450,26 +462,29 @@ class ReleasePlease(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> ReleasePlease:
         options: dict[str, object] = {
-            'token': token if token is not None else str(context.secrets.github_token),
-            'release-type': release_type,
-            'path': path,
-            'target-branch': target_branch,
-            'config-file': config_file,
-            'manifest-file': manifest_file,
-            'repo-url': repo_url,
-            'github-api-url': github_api_url,
-            'github-graphql-url': github_graphql_url,
-            'fork': fork,
-            'include-component-in-tag': include_component_in_tag,
-            'proxy-server': proxy_server,
-            'skip-github-release': skip_github_release,
-            'skip-github-pull-request': skip_github_pull_request,
-            'skip-labeling': skip_labeling,
-            'changelog-host': changelog_host,
-            'versioning-strategy': versioning_strategy,
-            'release-as': release_as,
+            k: v
+            for k, v in (
+                ('token', _DEFAULT_TOKEN if token is None else token),
+                ('release-type', release_type),
+                ('path', path),
+                ('target-branch', target_branch),
+                ('config-file', config_file),
+                ('manifest-file', manifest_file),
+                ('repo-url', repo_url),
+                ('github-api-url', github_api_url),
+                ('github-graphql-url', github_graphql_url),
+                ('fork', fork),
+                ('include-component-in-tag', include_component_in_tag),
+                ('proxy-server', proxy_server),
+                ('skip-github-release', skip_github_release),
+                ('skip-github-pull-request', skip_github_pull_request),
+                ('skip-labeling', skip_labeling),
+                ('changelog-host', changelog_host),
+                ('versioning-strategy', versioning_strategy),
+                ('release-as', release_as),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Run release-please'
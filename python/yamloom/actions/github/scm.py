@@ -6,18 +6,19 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['Checkout']
 
 
@@ -124,6 +125,7 @@ class Checkout(ActionStep):
     GitHub repository: https://github.com/actions/checkout
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -169,31 +171,34 @@ class Checkout(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> Checkout:
         options: dict[str, object] = {
-            'repository': repository,
-            'ref': ref,
-            'token': token,
-            'ssh-key': ssh_key,
-            'ssh-known-hosts': ssh_known_hosts,
-            'ssh-strict': ssh_strict,
-            'ssh-user': ssh_user,
-            'persist-credentials': persist_credentials,
-            'path': path,
-            'clean': clean,
-            'filter': filter,
-            'sparse-checkout': sparse_checkout,
-            'sparse-checkout-cone-mode': sparse_checkout_cone_mode,
-            'fetch-depth': fetch_depth,
-            'fetch-tags': fetch_tags,
-            'show-progress': show_progress,
-            'lfs': lfs,
-            'submodules': submodules,
-            'get-safe-directory': get_safe_directory,
-            'github-server-url': github_server_url,
+            k: v
+            for k, v in (
+                ('repository', repository),
+                ('ref', ref),
+                ('token', token),
+                ('ssh-key', ssh_key),
+                ('ssh-known-hosts', ssh_known_hosts),
+                ('ssh-strict', ssh_strict),
+                ('ssh-user', ssh_user),
+                ('persist-credentials', persist_credentials),
+                ('path', path),
+                ('clean', clean),
+                ('filter', filter),
+                ('sparse-checkout', sparse_checkout),
+                ('sparse-checkout-cone-mode', sparse_checkout_cone_mode),
+                ('fetch-depth', fetch_depth),
+                ('fetch-tags', fetch_tags),
+                ('show-progress', show_progress),
+                ('lfs', lfs),
+                ('submodules', submodules),
+                ('get-safe-directory', get_safe_directory),
+                ('github-server-url', github_server_url),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
-            repository_str = check_string(options.get('repository'))
+            repository_str = check_string(repository)
             if repository_str:
                 name = f"Checkout '{repository_str}'"
             else:
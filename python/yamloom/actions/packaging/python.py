@@ -1,21 +1,23 @@
 from __future__ import annotations
+from yamloom.actions.utils import join_strings
 from yamloom import Permissions
 
 from typing import TYPE_CHECKING
 
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['Maturin', 'PypiPublish']
 
 
@@ -86,6 +88,7 @@ class Maturin(ActionStep):
     GitHub repository: https://github.com/PyO3/maturin-action
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     def __new__(
@@ -103,7 +106,7 @@ class Maturin(ActionStep):
         host_home_mount: Ostrlike = None,
         target: Ostrlike = None,
         rust_toolchain: Ostrlike = None,
-        rustup_components: list[StringLike] | None = None,
+        rustup_components: list[StringLike] | tuple[StringLike, ...] | None = None,
         working_directory: Ostrlike = None,
         sccache: Oboollike = None,
         before_script_linux: Ostrlike = None,
@@ -116,25 +119,25 @@ class Maturin(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> Maturin:
         options: dict[str, object] = {
-            'token': token,
-            'command': command,
-            'maturin-version': maturin_version,
-            'manylinux': manylinux,
-            'target': target,
-            'container': container,
-            'docker-options': docker_options,
-            'host-home-mount': host_home_mount,
-            'rust-toolchain': rust_toolchain,
-            'rustup-components': ','.join(str(s) for s in rustup_components)
-            if rustup_components is not None
-            else None,
-            'working-directory': working_directory,
-            'sccache': sccache,
-            'before-script-linux': before_script_linux,
+            k: v
+            for k, v in (
+                ('token', token),
+                ('command', command),
+                ('maturin-version', maturin_version),
+                ('manylinux', manylinux),
+                ('target', target),
+                ('container', container),
+                ('docker-options', docker_options),
+                ('host-home-mount', host_home_mount),
+                ('rust-toolchain', rust_toolchain),
+                ('rustup-components', join_strings(rustup_components, ',')),
+                ('working-directory', working_directory),
+                ('sccache', sccache),
+                ('before-script-linux', before_script_linux),
+            )
+            if v is not None
         }
 
-        options = {key: value for key, value in options.items() if value is not None}
-
         if name is None:
             name = 'Maturin Action'
 
@@ -216,6 +219,7 @@ class PypiPublish(ActionStep):
     GitHub repository: https://github.com/pypa/gh-action-pypi-publish
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(id_token='write')
 
     def __new__(
@@ -242,17 +246,20 @@ class PypiPublish(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> PypiPublish:
         options: dict[str, object] = {
-            'user': user,
-            'password': password,
-            'repository-url': repository_url,
-            'packages-dir': packages_dir,
-            'verify-metadata': verify_metadata,
-            'skip-existing': skip_existing,
-            'verbose': verbose,
-            'print-hash': print_hash,
-            'attestations': attestations,
+            k: v
+            for k, v in (
+                ('user', user),
+                ('password', password),
+                ('repository-url', repository_url),
+                ('packages-dir', packages_dir),
+                ('verify-metadata', verify_metadata),
+                ('skip-existing', skip_existing),
+                ('verbose', verbose),
+                ('print-hash', print_hash),
+                ('attestations', attestations),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Publish to PyPI'
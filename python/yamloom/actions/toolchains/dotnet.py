@@ -6,20 +6,23 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupDotnet']
 
+_DOTNET_QUALITIES = frozenset(('daily', 'signed', 'validated', 'preview', 'ga'))
+
 
 class SetupDotnet(ActionStep):
     """Set up a specific version of the .NET SDK and optional NuGet auth.
@@ -84,6 +87,7 @@ class SetupDotnet(ActionStep):
     GitHub repository: https://github.com/actions/setup-dotnet
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -113,20 +117,24 @@ class SetupDotnet(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupDotnet:
         options: dict[str, object] = {
-            'dotnet-version': dotnet_version,
-            'dotnet-quality': validate_choice(
-                'dotnet-quality',
-                dotnet_quality,
-                ['daily', 'signed', 'validated', 'preview', 'ga'],
-            ),
-            'global-json-file': global_json_file,
-            'source-url': source_url,
-            'owner': owner,
-            'config-file': config_file,
-            'cache': cache,
-            'cache-dependency-path': cache_dependency_path,
+            k: v
+            for k, v in (
+                ('dotnet-version', dotnet_version),
+                (
+                    'dotnet-quality',
+                    validate_choice(
+                        'dotnet-quality', dotnet_quality, _DOTNET_QUALITIES
+                    ),
+                ),
+                ('global-json-file', global_json_file),
+                ('source-url', source_url),
+                ('owner', owner),
+                ('config-file', config_file),
+                ('cache', cache),
+                ('cache-dependency-path', cache_dependency_path),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup .NET'
@@ -5,18 +5,19 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupGo']
 
 
@@ -75,6 +76,7 @@ class SetupGo(ActionStep):
     GitHub repository: https://github.com/actions/setup-go
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -107,15 +109,18 @@ class SetupGo(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupGo:
         options: dict[str, object] = {
-            'go-version': go_version,
-            'go-version-file': go_version_file,
-            'check-latest': check_latest,
-            'architecture': architecture,
-            'token': token,
-            'cache': cache,
-            'cache-dependency-path': cache_dependency_path,
+            k: v
+            for k, v in (
+                ('go-version', go_version),
+                ('go-version-file', go_version_file),
+                ('check-latest', check_latest),
+                ('architecture', architecture),
+                ('token', token),
+                ('cache', cache),
+                ('cache-dependency-path', cache_dependency_path),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup Go'
@@ -6,20 +6,25 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupJava']
 
+_JAVA_PACKAGES = frozenset(('jdk', 'jre', 'jdk+fx', 'jre+fx'))
+_JAVA_CACHES = frozenset(('maven', 'gradle', 'sbt'))
+_JAVA_ARCHITECTURES = frozenset(('x86', 'x64', 'armv7', 'aarch64', 'ppc64le'))
+
 
 class SetupJava(ActionStep):
     """Set up a specific version of the Java JDK and add tools to PATH.
@@ -102,6 +107,7 @@ class SetupJava(ActionStep):
     GitHub repository: https://github.com/actions/setup-java
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -149,32 +155,35 @@ class SetupJava(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupJava:
         options: dict[str, object] = {
-            'java-version': java_version,
-            'java-version-file': java_version_file,
-            'distribution': distribution,
-            'java-package': validate_choice(
-                'java_package', java_package, ['jdk', 'jre', 'jdk+fx', 'jre+fx']
-            ),
-            'check-latest': check_latest,
-            'architecture': validate_choice(
-                'architecture',
-                architecture,
-                ['x86', 'x64', 'armv7', 'aarch64', 'ppc64le'],
-            ),
-            'jdkFile': jdk_file,
-            'cache': validate_choice('cache', cache, ['maven', 'gradle', 'sbt']),
-            'cache-dependency-path': cache_dependency_path,
-            'overwrite-settings': overwrite_settings,
-            'server-id': server_id,
-            'server-username': server_username,
-            'server-password': server_password,
-            'settings-path': settings_path,
-            'gpg-private-key': gpg_private_key,
-            'gpg-passphrase': gpg_passphrase,
-            'mvn-toolchain-id': mvn_toolchain_id,
-            'mvn-toolchain-vendor': mvn_toolchain_vendor,
+            k: v
+            for k, v in (
+                ('java-version', java_version),
+                ('java-version-file', java_version_file),
+                ('distribution', distribution),
+                (
+                    'java-package',
+                    validate_choice('java_package', java_package, _JAVA_PACKAGES),
+                ),
+                ('check-latest', check_latest),
+                (
+                    'architecture',
+                    validate_choice('architecture', architecture, _JAVA_ARCHITECTURES),
+                ),
+                ('jdkFile', jdk_file),
+                ('cache', validate_choice('cache', cache, _JAVA_CACHES)),
+                ('cache-dependency-path', cache_dependency_path),
+                ('overwrite-settings', overwrite_settings),
+                ('server-id', server_id),
+                ('server-username', server_username),
+                ('server-password', server_password),
+                ('settings-path', settings_path),
+                ('gpg-private-key', gpg_private_key),
+                ('gpg-passphrase', gpg_passphrase),
+                ('mvn-toolchain-id', mvn_toolchain_id),
+                ('mvn-toolchain-vendor', mvn_toolchain_vendor),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup Java'
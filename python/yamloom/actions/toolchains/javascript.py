@@ -4,18 +4,19 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupBun']
 
 
@@ -72,6 +73,7 @@ class SetupBun(ActionStep):
     GitHub repository: https://github.com/oven-sh/setup-bun
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -99,14 +101,17 @@ class SetupBun(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupBun:
         options: dict[str, object] = {
-            'bun-version': bun_version,
-            'bun-version-file': bun_version_file,
-            'bun-download-url': bun_download_url,
-            'registries': registries,
-            'no-cache': no_cache,
-            'token': token,
+            k: v
+            for k, v in (
+                ('bun-version', bun_version),
+                ('bun-version-file', bun_version_file),
+                ('bun-download-url', bun_download_url),
+                ('registries', registries),
+                ('no-cache', no_cache),
+                ('token', token),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup bun'
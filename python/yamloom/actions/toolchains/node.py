@@ -6,21 +6,24 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-    BoolLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        BoolLike,
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupNode', 'SetupPnpm']
 
+_NODE_CACHE_CHOICES = frozenset(('npm', 'yarn', 'pnpm'))
+
 
 class SetupNode(ActionStep):
     """Set up a Node.js environment.
@@ -87,6 +90,7 @@ class SetupNode(ActionStep):
     GitHub repository: https://github.com/actions/setup-node
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -124,22 +128,24 @@ class SetupNode(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupNode:
         options: dict[str, object] = {
-            'node-version': node_version,
-            'node-version-file': node_version_file,
-            'check-latest': check_latest,
-            'architecture': architecture,
-            'token': token,
-            'cache': validate_choice('cache', cache, ['npm', 'yarn', 'pnpm']),
-            'package-manager-cache': package_manager_cache,
-            'cache-dependency-path': cache_dependency_path,
-            'registry-url': registry_url,
-            'scope': scope,
-            'mirror': mirror,
-            'mirror-token': mirror_token,
+            k: v
+            for k, v in (
+                ('node-version', node_version),
+                ('node-version-file', node_version_file),
+                ('check-latest', check_latest),
+                ('architecture', architecture),
+                ('token', token),
+                ('cache', validate_choice('cache', cache, _NODE_CACHE_CHOICES)),
+                ('package-manager-cache', package_manager_cache),
+                ('cache-dependency-path', cache_dependency_path),
+                ('registry-url', registry_url),
+                ('scope', scope),
+                ('mirror', mirror),
+                ('mirror-token', mirror_token),
+            )
+            if v is not None
         }
 
-        options = {key: value for key, value in options.items() if value is not None}
-
         if name is None:
             name = 'Setup Node'
 
@@ -207,6 +213,7 @@ class SetupPnpm(ActionStep):
     GitHub repository: https://github.com/pnpm/action-setup
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -239,15 +246,18 @@ class SetupPnpm(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupPnpm:
         options: dict[str, object] = {
-            'version': pnpm_version,
-            'dest': dest,
-            'run_install': run_install,
-            'cache': cache,
-            'cache_dependency_path': cache_dependency_path,
-            'package_json_file': package_json_file,
-            'standalone': standalone,
+            k: v
+            for k, v in (
+                ('version', pnpm_version),
+                ('dest', dest),
+                ('run_install', run_install),
+                ('cache', cache),
+                ('cache_dependency_path', cache_dependency_path),
+                ('package_json_file', package_json_file),
+                ('standalone', standalone),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup pnpm'
@@ -5,20 +5,24 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupPhp']
 
+_INI_FILES = frozenset(('production', 'development', 'none'))
+_COVERAGE_DRIVERS = frozenset(('xdebug', 'pcov', 'none'))
+
 
 class SetupPhp(ActionStep):
     """Set up PHP.
@@ -76,6 +80,7 @@ class SetupPhp(ActionStep):
     GitHub repository: https://github.com/shivammathur/setup-php
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -105,20 +110,19 @@ class SetupPhp(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupPhp:
         options: dict[str, object] = {
-            'php-version': php_version,
-            'php-version-file': php_version_file,
-            'extensions': extensions,
-            'ini-file': validate_choice(
-                'ini_file', ini_file, ['production', 'development', 'none']
-            ),
-            'ini-values': ini_values,
-            'coverage': validate_choice(
-                'coverage', coverage, ['xdebug', 'pcov', 'none']
-            ),
-            'tools': tools,
-            'github-token': github_token,
+            k: v
+            for k, v in (
+                ('php-version', php_version),
+                ('php-version-file', php_version_file),
+                ('extensions', extensions),
+                ('ini-file', validate_choice('ini_file', ini_file, _INI_FILES)),
+                ('ini-values', ini_values),
+                ('coverage', validate_choice('coverage', coverage, _COVERAGE_DRIVERS)),
+                ('tools', tools),
+                ('github-token', github_token),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup PHP'
@@ -1,26 +1,29 @@
 from __future__ import annotations
 from yamloom import Permissions
-from yamloom.actions.utils import validate_choice
+from yamloom.actions.utils import join_strings, validate_choice
 
 from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringOrBoolLike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+        StringOrBoolLike,
+    )
+
 __all__ = ['SetupPython', 'SetupUV']
 
+_RESOLUTION_STRATEGIES = frozenset(('highest', 'lowest'))
+
 
 class SetupPython(ActionStep):
     """Set up a specific version of Python and add it to the PATH.
@@ -87,6 +90,7 @@ class SetupPython(ActionStep):
     GitHub repository: https://github.com/actions/setup-python
     """
 
+    __slots__ = ()
     recommended_permissions = Permissions(contents='read')
 
     @classmethod
@@ -128,20 +132,23 @@ class SetupPython(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupPython:
         options: dict[str, object] = {
-            'python-version': python_version,
-            'python-version-file': python_version_file,
-            'check-latest': check_latest,
-            'architecture': architecture,
-            'token': token,
-            'cache': cache,
-            'cache-dependency-path': cache_dependency_path,
-            'update-environment': update_environment,
-            'allow-prereleases': allow_prereleases,
-            'freethreaded': freethreaded,
-            'pip-version': pip_version,
-            'pip-install': pip_install,
+            k: v
+            for k, v in (
+                ('python-version', python_version),
+                ('python-version-file', python_version_file),
+                ('check-latest', check_latest),
+                ('architecture', architecture),
+                ('token', token),
+                ('cache', cache),
+                ('cache-dependency-path', cache_dependency_path),
+                ('update-environment', update_environment),
+                ('allow-prereleases', allow_prereleases),
+                ('freethreaded', freethreaded),
+                ('pip-version', pip_version),
+                ('pip-install', pip_install),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup Python'
@@ -249,6 +256,7 @@ class SetupUV(ActionStep):
     GitHub repository: https://github.com/astral-sh/setup-uv
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -297,7 +305,7 @@ class SetupUV(ActionStep):
         checksum: Ostrlike = None,
         github_token: Ostrlike = None,
         enable_cache: StringOrBoolLike | None = None,
-        cache_dependency_glob: list[StringLike] | None = None,
+        cache_dependency_glob: list[StringLike] | tuple[StringLike, ...] | None = None,
         restore_cache: Oboollike = None,
         save_cache: Oboollike = None,
         cache_suffix: Ostrlike = None,
@@ -319,46 +327,50 @@ class SetupUV(ActionStep):
         timeout_minutes: Ointlike = None,
         skip_recommended_permissions: bool = False,
     ) -> SetupUV:
-        options: dict[str, object] = {
-            'version': uv_version,
-            'version-file': uv_version_file,
-            'resolution-strategy': validate_choice(
-                'resolution_strategy', resolution_strategy, ['highest', 'lowest']
-            ),
-            'python-version': python_version,
-            'activate-environment': activate_environment,
-            'working-directory': working_directory,
-            'checksum': checksum,
-            'github-token': github_token,
-            'enable-cache': enable_cache,
-            'cache-dependency-glob': '\n'.join(str(s) for s in cache_dependency_glob)
-            if cache_dependency_glob is not None
-            else None,
-            'restore-cache': restore_cache,
-            'save-cache': save_cache,
-            'cache-suffix': cache_suffix,
-            'cache-local-path': cache_local_path,
-            'prune-cache': prune_cache,
-            'cache-python': cache_python,
-            'ignore-nothing-to-cache': ignore_nothing_to_cache,
-            'ignore-empty-workdir': ignore_empty_workdir,
-            'tool-dir': tool_dir,
-            'tool-bin-dir': tool_bin_dir,
-            'manifest-file': manifest_file,
-            'add-problem-matchers': add_problem_matchers,
-        }
         if enable_cache is not None:
             if isinstance(enable_cache, str):
                 if enable_cache.lower() != 'auto':
                     msg = "'enable_cache' must be 'auto', true or false"
                     raise ValueError(msg)
-                options['enable-cache'] = 'auto'
-            elif isinstance(enable_cache, bool):
-                options['enable-cache'] = enable_cache
-            else:
+                enable_cache = 'auto'
+            elif not isinstance(enable_cache, bool):
                 raise TypeError('enable_cache must be a bool or a string')
 
-        options = {key: value for key, value in options.items() if value is not None}
+        options: dict[str, object] = {
+            k: v
+            for k, v in (
+                ('version', uv_version),
+                ('version-file', uv_version_file),
+                (
+                    'resolution-strategy',
+                    validate_choice(
+                        'resolution_strategy',
+                        resolution_strategy,
+                        _RESOLUTION_STRATEGIES,
+                    ),
+                ),
+                ('python-version', python_version),
+                ('activate-environment', activate_environment),
+                ('working-directory', working_directory),
+                ('checksum', checksum),
+                ('github-token', github_token),
+                ('enable-cache', enable_cache),
+                ('cache-dependency-glob', join_strings(cache_dependency_glob, '\n')),
+                ('restore-cache', restore_cache),
+                ('save-cache', save_cache),
+                ('cache-suffix', cache_suffix),
+                ('cache-local-path', cache_local_path),
+                ('prune-cache', prune_cache),
+                ('cache-python', cache_python),
+                ('ignore-nothing-to-cache', ignore_nothing_to_cache),
+                ('ignore-empty-workdir', ignore_empty_workdir),
+                ('tool-dir', tool_dir),
+                ('tool-bin-dir', tool_bin_dir),
+                ('manifest-file', manifest_file),
+                ('add-problem-matchers', add_problem_matchers),
+            )
+            if v is not None
+        }
 
         if name is None:
             name = 'Setup uv'
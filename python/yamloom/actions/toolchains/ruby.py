@@ -5,20 +5,23 @@ from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupRuby']
 
+_WINDOWS_TOOLCHAINS = frozenset(('default', 'none'))
+
 
 class SetupRuby(ActionStep):
     """Set up Ruby, JRuby, or TruffleRuby and add it to the PATH.
@@ -80,6 +83,7 @@ class SetupRuby(ActionStep):
     GitHub repository: https://github.com/ruby/setup-ruby
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -110,19 +114,25 @@ class SetupRuby(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupRuby:
         options: dict[str, object] = {
-            'ruby-version': ruby_version,
-            'rubygems': rubygems,
-            'bundler': bundler,
-            'bundler-cache': bundler_cache,
-            'working-directory': working_directory,
-            'cache-version': cache_version,
-            'self-hosted': self_hosted,
-            'windows-toolchain': validate_choice(
-                'windows-toolchain', windows_toolchain, ['default', 'none']
-            ),
-            'token': token,
+            k: v
+            for k, v in (
+                ('ruby-version', ruby_version),
+                ('rubygems', rubygems),
+                ('bundler', bundler),
+                ('bundler-cache', bundler_cache),
+                ('working-directory', working_directory),
+                ('cache-version', cache_version),
+                ('self-hosted', self_hosted),
+                (
+                    'windows-toolchain',
+                    validate_choice(
+                        'windows-toolchain', windows_toolchain, _WINDOWS_TOOLCHAINS
+                    ),
+                ),
+                ('token', token),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup Ruby'
@@ -1,24 +1,28 @@
 from __future__ import annotations
-from yamloom.actions.utils import validate_choice
+from yamloom.actions.utils import join_strings, validate_choice
 
 from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['InstallRustTool', 'SetupRust']
 
+_RUST_CACHE_PROVIDERS = frozenset(('github', 'buildjet', 'warpbuild'))
+_RUST_FALLBACKS = frozenset(('none', 'cargo-binstall', 'cargo-install'))
+
 
 class SetupRust(ActionStep):
     """Set up Rust toolchains with optional caching.
@@ -96,6 +100,7 @@ class SetupRust(ActionStep):
     GitHub repository: https://github.com/actions-rust-lang/setup-rust-toolchain
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -121,10 +126,10 @@ class SetupRust(ActionStep):
         version: str = 'v1',
         toolchain: Ostrlike = None,
         target: Ostrlike = None,
-        components: list[StringLike] | None = None,
+        components: list[StringLike] | tuple[StringLike, ...] | None = None,
         cache: Oboollike = None,
-        cache_directories: list[StringLike] | None = None,
-        cache_workspaces: list[StringLike] | None = None,
+        cache_directories: list[StringLike] | tuple[StringLike, ...] | None = None,
+        cache_workspaces: list[StringLike] | tuple[StringLike, ...] | None = None,
         cache_on_failure: Oboollike = None,
         cache_key: Ostrlike = None,
         cache_shared_key: Ostrlike = None,
@@ -146,33 +151,33 @@ class SetupRust(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> SetupRust:
         options: dict[str, object] = {
-            'toolchain': toolchain,
-            'target': target,
-            'components': ','.join(str(s) for s in components)
-            if components is not None
-            else None,
-            'cache': cache,
-            'cache-directories': '\n'.join(str(s) for s in cache_directories)
-            if cache_directories is not None
-            else None,
-            'cache-workspaces': '\n'.join(str(s) for s in cache_workspaces)
-            if cache_workspaces is not None
-            else None,
-            'cache-on-failure': cache_on_failure,
-            'cache-key': cache_key,
-            'cache-shared-key': cache_shared_key,
-            'cache-bin': cache_bin,
-            'cache-provider': validate_choice(
-                'cache_provider', cache_provider, ['github', 'buildjet', 'warpbuild']
-            ),
-            'cache-all-crates': cache_all_crates,
-            'cache-workspace-crates': cache_workspace_crates,
-            'matcher': matcher,
-            'rustflags': rustflags,
-            'override': override,
-            'rust-src-dir': rust_src_dir,
+            k: v
+            for k, v in (
+                ('toolchain', toolchain),
+                ('target', target),
+                ('components', join_strings(components, ',')),
+                ('cache', cache),
+                ('cache-directories', join_strings(cache_directories, '\n')),
+                ('cache-workspaces', join_strings(cache_workspaces, '\n')),
+                ('cache-on-failure', cache_on_failure),
+                ('cache-key', cache_key),
+                ('cache-shared-key', cache_shared_key),
+                ('cache-bin', cache_bin),
+                (
+                    'cache-provider',
+                    validate_choice(
+                        'cache_provider', cache_provider, _RUST_CACHE_PROVIDERS
+                    ),
+                ),
+                ('cache-all-crates', cache_all_crates),
+                ('cache-workspace-crates', cache_workspace_crates),
+                ('matcher', matcher),
+                ('rustflags', rustflags),
+                ('override', override),
+                ('rust-src-dir', rust_src_dir),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Setup Rust'
@@ -241,12 +246,13 @@ class InstallRustTool(ActionStep):
     GitHub repository: https://github.com/taiki-e/install-action
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     def __new__(
         cls,
         *,
-        tool: list[StringLike],
+        tool: list[StringLike] | tuple[StringLike, ...],
         name: Ostrlike = None,
         version: str = 'v2',
         checksum: Oboollike = None,
@@ -261,13 +267,14 @@ class InstallRustTool(ActionStep):
         skip_recommended_permissions: bool = False,
     ) -> InstallRustTool:
         options: dict[str, object] = {
-            'tool': ','.join(str(s) for s in tool),
-            'checksum': checksum,
-            'fallback': validate_choice(
-                'fallback', fallback, ['none', 'cargo-binstall', 'cargo-install']
-            ),
+            k: v
+            for k, v in (
+                ('tool', join_strings(tool, ',')),
+                ('checksum', checksum),
+                ('fallback', validate_choice('fallback', fallback, _RUST_FALLBACKS)),
+            )
+            if v is not None
         }
-        options = {key: value for key, value in options.items() if value is not None}
 
         if name is None:
             name = 'Install Rust Tool'
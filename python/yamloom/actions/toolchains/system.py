@@ -1,24 +1,28 @@
 from __future__ import annotations
-from yamloom.actions.utils import validate_choice, check_string
+from yamloom.actions.utils import validate_choice
 
 from typing import TYPE_CHECKING
 
 from ...expressions import context, StringExpression
 from ..._yamloom import ActionStep
-from ..types import (
-    Oboollike,
-    Oboolstr,
-    Ointlike,
-    Ostr,
-    Ostrlike,
-    StringLike,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from ..types import (
+        Oboollike,
+        Oboolstr,
+        Ointlike,
+        Ostr,
+        Ostrlike,
+        StringLike,
+    )
+
 __all__ = ['SetupMPI']
 
+_MPI_CHOICES = frozenset(('mpich', 'openmpi', 'intelmpi', 'msmpi'))
+_MPI_STEP_NAMES = {choice: f'Setup {choice}' for choice in _MPI_CHOICES}
+
 
 class SetupMPI(ActionStep):
     """Set up a specific MPI implementation.
@@ -62,6 +66,7 @@ class SetupMPI(ActionStep):
     GitHub repository: https://github.com/mpi4py/setup-mpi
     """
 
+    __slots__ = ()
     recommended_permissions = None
 
     @classmethod
@@ -83,20 +88,13 @@ class SetupMPI(ActionStep):
         timeout_minutes: Ointlike = None,
         skip_recommended_permissions: bool = False,
     ) -> SetupMPI:
-        options: dict[str, object] = {
-            'mpi': validate_choice(
-                'mpi', mpi, ['mpich', 'openmpi', 'intelmpi', 'msmpi']
-            ),
-        }
-
-        options = {key: value for key, value in options.items() if value is not None}
+        mpi = validate_choice('mpi', mpi, _MPI_CHOICES)
+        options: dict[str, object] = {} if mpi is None else {'mpi': mpi}
 
         if name is None:
-            mpi_str = check_string(options.get('mpi'))
-            if mpi_str:
-                name = f'Setup {mpi_str}'
-            else:
-                name = 'Setup MPI'
+            # A validated plain string is one of the fixed choices, so it
+            # cannot contain an expression.
+            name = _MPI_STEP_NAMES[mpi] if type(mpi) is str else 'Setup MPI'
 
         return super().__new__(
             cls,
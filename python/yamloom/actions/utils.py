@@ -1,32 +1,55 @@
-from yamloom.actions.types import Ostrlike
-from collections.abc import Sequence
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from yamloom.actions.types import Ostrlike, StringLike
+
+T = TypeVar('T')
+
+
+def _choices_error(option_name: str, choices: Collection[str]) -> ValueError:
+    quoted_choices = [f"'{c}'" for c in sorted(choices)]
+    if len(quoted_choices) > 2:
+        choices_str = f'{", ".join(quoted_choices[:-1])}, or {quoted_choices[-1]}'
+    else:
+        choices_str = ' or '.join(quoted_choices)
+    return ValueError(f"'{option_name}' must be {choices_str}")
 
 
 def validate_choice(
-    option_name: str, option_value: Ostrlike, choices: Sequence[str]
+    option_name: str, option_value: Ostrlike, choices: Collection[str]
 ) -> Ostrlike:
-    if option_value is not None:
-        if isinstance(option_value, str):
-            lowered = option_value.lower()
-            if option_value not in choices:
-                quoted_choices = [f"'{c}'" for c in choices]
-                if len(choices) > 2:
-                    choices_str = (
-                        f'{", ".join(quoted_choices[:-1])}, or {quoted_choices[-1]}'
-                    )
-                else:
-                    choices_str = ' or '.join(quoted_choices)
-                msg = f"'{option_name}' must be {choices_str}"
-                raise ValueError(msg)
-            return lowered
-        else:
-            return option_value
-    else:
+    if option_value is None or not isinstance(option_value, str):
+        return option_value
+    # Choices are lowercase, so most inputs need no new string.
+    lowered = option_value if option_value.islower() else option_value.lower()
+    if lowered not in choices:
+        raise _choices_error(option_name, choices)
+    return lowered
+
+
+def as_list(values: Iterable[T] | None) -> list[T] | None:
+    if values is None:
+        return None
+    return values if type(values) is list else list(values)
+
+
+def join_strings(values: Iterable[StringLike] | None, sep: str) -> str | None:
+    if values is None:
         return None
+    if type(values) is not list and type(values) is not tuple:
+        # The fallback below walks the values again, so one-shot iterables are
+        # materialized first.
+        values = list(values)
+    try:
+        # Plain strings, the common case, are joined directly in C.
+        return sep.join(values)
+    except TypeError:
+        return sep.join([str(s) for s in values])
 
 
 def check_string(s: object | None) -> str | None:
-    if isinstance(s, str):
-        if '${{' not in s:
-            return s
-    return None
+    return s if type(s) is str and '${{' not in s else None
@@ -0,0 +1,148 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from yamloom.__main__ import local_sources, main
+
+
+def write_generator(tmp_path: Path, body: str) -> Path:
+    target = tmp_path / 'generator.py'
+    target.write_text(body)
+    return target
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache = tmp_path / 'cache'
+    monkeypatch.setenv('XDG_CACHE_HOME', str(cache))
+    return cache
+
+
+def run_main(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr(sys, 'argv', ['yamloom', *args])
+    return main()
+
+
+def test_main_runs_generator_as_main(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    out = tmp_path / 'out.txt'
+    target = write_generator(
+        tmp_path,
+        'import sys\n'
+        'from pathlib import Path\n'
+        'if __name__ == "__main__":\n'
+        f'    Path({str(out)!r}).write_text(sys.argv[0])\n',
+    )
+    assert run_main(monkeypatch, '--file', str(target)) == 0
+    assert out.read_text() == str(target)
+
+
+def test_main_caches_generator_bytecode_outside_project(
+    tmp_path: Path, cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+    target = write_generator(tmp_path, 'raise SystemExit(3)\n')
+    for _ in range(2):
+        assert run_main(monkeypatch, '--file', str(target)) == 3
+    assert len(list((cache_home / 'yamloom' / 'bytecode').iterdir())) == 1
+    assert not (tmp_path / '__pycache__').exists()
+
+    target.write_text('raise SystemExit(5)\n')
+    assert run_main(monkeypatch, '--file', str(target)) == 5
+
+
+def test_main_cache_skips_unchanged_generator(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    runs = tmp_path / 'runs.txt'
+    target = write_generator(
+        tmp_path,
+        'from pathlib import Path\n'
+        'Path(".github/workflows").mkdir(parents=True, exist_ok=True)\n'
+        'Path(".github/workflows/ci.yml").write_text("name: ci\\n")\n'
+        f'with open({str(runs)!r}, "a") as f:\n'
+        '    f.write("x")\n',
+    )
+    for _ in range(2):
+        assert run_main(monkeypatch, '--cache', '--file', str(target)) == 0
+    assert runs.read_text() == 'x'
+
+    (tmp_path / '.github' / 'workflows' / 'ci.yml').write_text('name: edited\n')
+    assert run_main(monkeypatch, '--cache', '--file', str(target)) == 0
+    assert runs.read_text() == 'xx'
+
+
+def test_main_cache_tracks_local_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delitem(sys.modules, 'yamloom_test_helper', raising=False)
+    helper = tmp_path / 'yamloom_test_helper.py'
+    helper.write_text('NAME = "ci"\n')
+    runs = tmp_path / 'runs.txt'
+    target = write_generator(
+        tmp_path,
+        'from pathlib import Path\n'
+        'import yamloom_test_helper\n'
+        'Path(".github/workflows").mkdir(parents=True, exist_ok=True)\n'
+        'Path(".github/workflows/ci.yml").write_text(yamloom_test_helper.NAME)\n'
+        f'with open({str(runs)!r}, "a") as f:\n'
+        '    f.write("x")\n',
+    )
+    for _ in range(2):
+        assert run_main(monkeypatch, '--cache', '--file', str(target)) == 0
+    assert runs.read_text() == 'x'
+
+    helper.write_text('NAME = "edited"\n')
+    assert run_main(monkeypatch, '--cache', '--file', str(target)) == 0
+    assert runs.read_text() == 'xx'
+    sys.modules.pop('yamloom_test_helper', None)
+
+
+def test_local_sources_skip_project_venv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    venv = tmp_path / '.venv'
+    site_packages = venv / 'lib' / 'site-packages'
+    site_packages.mkdir(parents=True)
+    installed = site_packages / 'yamloom_test_installed.py'
+    installed.write_text('')
+    helper = tmp_path / 'yamloom_test_helper.py'
+    helper.write_text('')
+    monkeypatch.setattr(sys, 'prefix', str(venv))
+    for name, path in (
+        ('yamloom_test_installed', installed),
+        ('yamloom_test_helper', helper),
+    ):
+        module = types.ModuleType(name)
+        module.__file__ = str(path)
+        monkeypatch.setitem(sys.modules, name, module)
+    target = write_generator(tmp_path, 'pass\n')
+    assert list(local_sources(target)) == [str(helper.resolve())]
+
+
+def test_main_propagates_exit_code(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = write_generator(tmp_path, 'raise SystemExit(3)\n')
+    assert run_main(monkeypatch, '--file', str(target)) == 3
+
+
+def test_main_restores_interpreter_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = write_generator(tmp_path, 'pass\n')
+    path = sys.path[:]
+    assert run_main(monkeypatch, '--file', str(target)) == 0
+    assert sys.argv == ['yamloom', '--file', str(target)]
+    assert sys.path == path
+
+
+def test_main_subprocess_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = write_generator(tmp_path, 'raise SystemExit(4)\n')
+    assert run_main(monkeypatch, '--subprocess', '--file', str(target)) == 4
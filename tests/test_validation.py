@@ -1,6 +1,24 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
 import pytest
 
-from yamloom import Job, Permissions, WorkflowInput, action, script
+from yamloom import (
+    Events,
+    Job,
+    Permissions,
+    PushEvent,
+    Workflow,
+    WorkflowInput,
+    action,
+    script,
+)
+from yamloom.actions.github.artifacts import DownloadArtifact, UploadArtifact
+from yamloom.actions.github.cache import Cache, CacheRestore
+from yamloom.actions.toolchains.rust import SetupRust
+from yamloom.actions.utils import join_strings
 from yamloom.expressions import context
 
 
@@ -150,3 +168,118 @@ def test_script_expression_line_escapes_control_chars_without_block_scalar() ->
         '\n  - run: printf "%s\\n" ${{ join(matrix.platform.python_versions, \' \') }} >> version.txt'
         in job_yaml
     )
+
+
+def test_action_choice_options_are_case_insensitive() -> None:
+    step_yaml = str(SetupRust(cache_provider='GitHub'))
+    assert 'cache-provider: github' in step_yaml
+    with pytest.raises(ValueError, match="'cache_provider' must be"):
+        SetupRust(cache_provider='gitlab')
+
+
+def test_action_steps_do_not_carry_instance_dict() -> None:
+    assert not hasattr(SetupRust(), '__dict__')
+
+
+def test_artifact_steps_are_named_after_the_artifact() -> None:
+    assert 'name: Upload wheels' in str(
+        UploadArtifact(path='dist', artifact_name='wheels')
+    )
+    assert 'name: Download Artifact' in str(DownloadArtifact())
+    step_yaml = str(DownloadArtifact(artifact_name=context.vars.artifact))
+    assert 'name: Download Artifact' in step_yaml
+
+
+def test_upload_artifact_emits_hyphenated_if_no_files_found() -> None:
+    step_yaml = str(UploadArtifact(path='dist', if_no_files_found='error'))
+    assert 'if-no-files-found: error' in step_yaml
+    assert 'if_no_files_found' not in step_yaml
+
+
+def test_upload_artifact_warns_on_long_retention() -> None:
+    with pytest.warns(UserWarning, match='retention days should be <= 90'):
+        UploadArtifact(path='dist', retention_days=91)
+
+
+def _workflow(message: str) -> Workflow:
+    return Workflow(
+        name='ci',
+        on=Events(push=PushEvent(branches=['main'])),
+        jobs={'check': Job(steps=[script(message)], runs_on='ubuntu-latest')},
+    )
+
+
+def test_workflow_dump_rewrites_same_length_changes(tmp_path: Path) -> None:
+    out = tmp_path / 'ci.yml'
+    _workflow('echo one').dump(out)
+    os.utime(out, ns=(0, 0))
+    _workflow('echo two').dump(out)
+    assert 'echo two' in out.read_text()
+    assert 'echo one' not in out.read_text()
+    assert out.stat().st_mtime_ns != 0
+
+
+@pytest.mark.parametrize('cache_step', [Cache, CacheRestore])
+def test_cache_segment_timeout_merges_into_env(
+    cache_step: type[Cache | CacheRestore],
+) -> None:
+    step_yaml = str(cache_step(key='k', segment_download_timeout_mins=5))
+    assert 'SEGMENT_DOWNLOAD_TIMEOUT_MINS: "5"' in step_yaml
+    step_yaml = str(
+        cache_step(key='k', segment_download_timeout_mins=5, env={'FOO': 'bar'})
+    )
+    assert 'FOO: bar' in step_yaml
+    assert 'SEGMENT_DOWNLOAD_TIMEOUT_MINS: "5"' in step_yaml
+
+
+def test_step_with_opts_rejects_disallowed_context() -> None:
+    job_output = context.jobs.build.outputs.version
+    with pytest.raises(RuntimeError, match='jobs.<job_id>.steps.with'):
+        action('x', 'owner/repo', with_opts={'version': job_output})
+    with pytest.raises(RuntimeError, match='jobs.<job_id>.steps.with'):
+        SetupRust(toolchain=job_output)
+
+
+def test_reusable_job_with_opts_rejects_disallowed_context() -> None:
+    with pytest.raises(RuntimeError, match='jobs.<job_id>.with.<with_id>'):
+        Job(
+            uses='org/repo/.github/workflows/reuse.yml@v1',
+            with_opts={'token': context.secrets.github_token},
+        )
+
+
+def test_with_opts_convert_plain_and_expression_values() -> None:
+    step_yaml = str(
+        action(
+            'x',
+            'owner/repo',
+            with_opts={
+                'expr': context.vars.name,
+                'plain': 'text',
+                'number': 3,
+                'flag': True,
+                'items': ['a', context.vars.item],
+                'mapping': {'k': 1},
+            },
+        )
+    )
+    assert step_yaml == (
+        '---\n'
+        'name: x\n'
+        'uses: owner/repo\n'
+        'with:\n'
+        '  expr: ${{ vars.name }}\n'
+        '  plain: text\n'
+        '  number: 3\n'
+        '  flag: true\n'
+        '  items:\n'
+        '    - a\n'
+        '    - ${{ vars.item }}\n'
+        '  mapping:\n'
+        '    k: 1'
+    )
+
+
+def test_join_strings_handles_one_shot_iterables() -> None:
+    assert join_strings((x for x in ['a', 1]), ',') == 'a,1'
+    assert join_strings(['a', context.vars.b], ',') == 'a,${{ vars.b }}'